@@ -6,6 +6,8 @@ from typing import Iterable
 
 from ..core import Entry, NodeKind, SourceAdapter
 
+_NATIVE_POSIX = os.sep == "/"
+
 
 def _to_posix(path: Path) -> PurePosixPath:
     # Normalize to POSIX-like logical paths for cross-source formatting
@@ -20,9 +22,8 @@ class FileSystemSource(SourceAdapter):
         return _to_posix((self._cwd / root_spec).resolve())
 
     def list_dir(self, dir_path: PurePosixPath) -> Iterable[Entry]:
-        p = Path(str(dir_path))
         entries: list[Entry] = []
-        with os.scandir(p) as it:
+        with os.scandir(str(dir_path)) as it:
             for e in it:
                 if e.is_dir(follow_symlinks=False):
                     kind = NodeKind.DIRECTORY
@@ -30,32 +31,30 @@ class FileSystemSource(SourceAdapter):
                     kind = NodeKind.FILE
                 else:
                     kind = NodeKind.OTHER
-                entries.append(
-                    Entry(
-                        path=_to_posix(Path(e.path)),
-                        name=e.name,
-                        kind=kind,
-                    )
-                )
+                # On POSIX, scandir paths are already POSIX; skip the Path round-trip
+                path = PurePosixPath(e.path) if _NATIVE_POSIX else _to_posix(Path(e.path))
+                entries.append(Entry(path=path, name=e.name, kind=kind))
         return entries
 
     def read_file_bytes(self, file_path: PurePosixPath) -> bytes:
-        p = Path(str(file_path))
         try:
-            with p.open("rb") as f:
-                return f.read()
+            return _read_bytes(file_path)
         except Exception:
             return b""
 
     def is_empty(self, file_path: PurePosixPath) -> bool:
-        # Read bytes and use shared semantic emptiness check
-        p = Path(str(file_path))
-        if not p.is_file():
-            return False
+        # Read bytes and use shared semantic emptiness check.
+        # The engine only asks about regular files, so a failed read means "not empty".
         try:
-            blob = p.read_bytes()
+            blob = _read_bytes(file_path)
         except Exception:
             return False
         from ..core import is_blob_semantically_empty
 
         return is_blob_semantically_empty(blob)
+
+
+def _read_bytes(file_path: PurePosixPath) -> bytes:
+    # Unbuffered: FileIO.readall sizes one read from fstat, skipping the BufferedReader layer
+    with Path(str(file_path)).open("rb", buffering=0) as f:
+        return f.readall()
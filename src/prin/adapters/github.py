@@ -3,18 +3,61 @@ from __future__ import annotations
 import base64
 import functools
 import os
+import re
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import suppress
 from dataclasses import dataclass
 from pathlib import PurePosixPath
 from typing import Dict, Iterable, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from ..core import Entry, NodeKind, SourceAdapter
 
 API_BASE = "https://api.github.com"
+HTTP_CACHE_NAME = "prin-github"
 MAX_WAIT_SECONDS = 180
+# Below this share of the window's quota (X-RateLimit-Limit), spread the rest evenly until reset
+RATE_LIMIT_PACING_FRACTION = 0.1
+# Listings and blobs fetched ahead of the traversal; bounded to stay friendly with rate limits
+PREFETCH_WORKERS = 8
+MAX_PENDING_PREFETCHES = 64
+
+
+class _BlobCache:
+    """
+    Blob contents keyed by git SHA. A SHA pins the content, so entries never go stale and can be
+    shared by every source in the process; oldest entries are dropped past the byte budget.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        self._max_bytes = max_bytes
+        self._blobs: dict[str, bytes] = {}
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, sha: str) -> bytes | None:
+        return self._blobs.get(sha)
+
+    def put(self, sha: str, blob: bytes) -> None:
+        if len(blob) > self._max_bytes:
+            return
+        with self._lock:
+            if sha in self._blobs:
+                return
+            self._blobs[sha] = blob
+            self._size += len(blob)
+            while self._size > self._max_bytes:
+                self._size -= len(self._blobs.pop(next(iter(self._blobs))))
+
+
+_blob_cache = _BlobCache(max_bytes=32 * 1024 * 1024)
+# (owner, repo) -> default branch; kept off the sources so they can be garbage-collected
+_default_branches: dict[tuple[str, str], str] = {}
 
 
 def _auth_headers() -> Dict[str, str]:
@@ -25,15 +68,45 @@ def _auth_headers() -> Dict[str, str]:
     return headers
 
 
+@functools.cache
+def _shared_session(cache: bool) -> requests.Session:
+    # Every source in the process (several repos, repeated runs) reuses the same TLS connections
+    return _new_session(cache=cache)
+
+
+def _new_session(*, cache: bool = True) -> requests.Session:
+    # One keep-alive pool for the whole run; sized for the prefetch workers
+    if cache:
+        # Conditional requests: GitHub answers unchanged resources with a 304 that costs no rate limit
+        from requests_cache import CachedSession
+
+        session = CachedSession(
+            HTTP_CACHE_NAME,
+            backend="sqlite",
+            use_cache_dir=True,
+            cache_control=True,
+            expire_after=3600,
+        )
+    else:
+        session = requests.Session()
+    retries = Retry(
+        total=3, backoff_factor=0.3, status_forcelist=(502, 503, 504), raise_on_status=False
+    )
+    session.mount(
+        "https://", HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=retries)
+    )
+    return session
+
+
+# Same prefixes as util.is_github_url: optional git+ and scheme, optional www., any case
+_OWNER_REPO_RE = re.compile(
+    r"(?:(?:git\+)?https?://)?(?:www\.)?github\.com/([^/]+)/([^/]+?)(?:\.git)?(?:/|$)",
+    re.IGNORECASE,
+)
+
+
 def _parse_owner_repo(url: str) -> tuple[str, str]:
-    import re
-
-    raw = url.strip()
-    if raw.startswith("git+"):
-        raw = raw[4:]
-    if not re.match(r"^[a-z]+://", raw):
-        raw = "https://" + raw  # allow scheme-less inputs like github.com/owner/repo
-    m = re.match(r"https?://github\.com/([^/]+)/([^/]+?)(?:\.git)?(?:/|$)", raw)
+    m = _OWNER_REPO_RE.match(url.strip())
     if not m:
         msg = f"Unrecognized GitHub URL: {url}"
         raise ValueError(msg)
@@ -54,6 +127,23 @@ def _parse_rate_limit_wait_seconds(resp: requests.Response) -> Optional[int]:
     return None
 
 
+def _pace_for_rate_limit(resp: requests.Response) -> None:
+    if getattr(resp, "from_cache", False):
+        return
+    limit = resp.headers.get("X-RateLimit-Limit")
+    remaining = resp.headers.get("X-RateLimit-Remaining")
+    reset = resp.headers.get("X-RateLimit-Reset")
+    if limit is None or remaining is None or reset is None:
+        return
+    with suppress(ValueError):
+        remaining_n = int(remaining)
+        if remaining_n >= int(limit) * RATE_LIMIT_PACING_FRACTION:
+            return
+        window = float(reset) - time.time()
+        if window > 0:
+            time.sleep(min(window / max(remaining_n, 1), MAX_WAIT_SECONDS))
+
+
 def _get(session: requests.Session, url: str, *, params=None, stream=False) -> requests.Response:
     for attempt in range(2):
         resp = session.get(url, params=params, stream=stream)
@@ -68,6 +158,7 @@ def _get(session: requests.Session, url: str, *, params=None, stream=False) -> r
                     time.sleep(wait)
                     continue
         if 200 <= resp.status_code < 300:
+            _pace_for_rate_limit(resp)
             return resp
         resp.raise_for_status()
     return resp
@@ -81,24 +172,131 @@ class _Ctx:
 
 
 class GitHubRepoSource(SourceAdapter):
-    def __init__(self, url: str, session: Optional[requests.Session] = None) -> None:
-        self._session = session or requests.Session()
+    def __init__(
+        self, url: str, session: Optional[requests.Session] = None, *, cache: bool = True
+    ) -> None:
+        self._session = session or _shared_session(cache)
         self._session.headers.update(_auth_headers())
         owner, repo = _parse_owner_repo(url)
         ref = self._fetch_default_branch(owner, repo)
         self._ctx = _Ctx(owner=owner, repo=repo, ref=ref)
+        # File path -> blob SHA, learned from the tree or listings; keys the shared blob cache
+        self._shas: dict[str, str] = {}
+        # File path -> byte size from the same listings; zero-byte files are never fetched
+        self._sizes: dict[str, int] = {}
+        self._listings: dict[str, list[Entry]] = {}
+        # Directory path ("" for the root) -> children, from one recursive tree fetch.
+        # None when the tree was truncated; listings then go through the Contents API.
+        self._tree: dict[str, list[Entry]] | None = self._fetch_recursive_tree()
+        self._pool: ThreadPoolExecutor | None = None
+        self._pending_listings: dict[str, Future[list[Entry]]] = {}
+        self._pending_blobs: dict[str, Future[bytes]] = {}
+
+    def __enter__(self) -> GitHubRepoSource:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Stop prefetching: queued fetches are cancelled and the worker threads exit."""
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
+        self._pending_listings.clear()
+        self._pending_blobs.clear()
 
-    @functools.lru_cache
     def _fetch_default_branch(self, owner: str, repo: str) -> str:
-        r = _get(self._session, f"{API_BASE}/repos/{owner}/{repo}")
-        return r.json()["default_branch"]
+        branch = _default_branches.get((owner, repo))
+        if branch is None:
+            r = _get(self._session, f"{API_BASE}/repos/{owner}/{repo}")
+            branch = _default_branches[owner, repo] = r.json()["default_branch"]
+        return branch
 
     def resolve_root(self, root_spec: str) -> PurePosixPath:
         # We treat the repo root as empty path
         return PurePosixPath(root_spec or "")
 
+    def _fetch_recursive_tree(self) -> dict[str, list[Entry]] | None:
+        owner, repo, ref = self._ctx.owner, self._ctx.repo, self._ctx.ref
+        r = _get(
+            self._session,
+            f"{API_BASE}/repos/{owner}/{repo}/git/trees/{ref}",
+            params={"recursive": "1"},
+        )
+        data = r.json()
+        if data.get("truncated"):
+            return None
+        tree: dict[str, list[Entry]] = {"": []}
+        for it in data.get("tree", []):
+            it_path = it["path"]
+            parent, _, name = it_path.rpartition("/")
+            kind = NodeKind.OTHER
+            if it.get("type") == "tree":
+                kind = NodeKind.DIRECTORY
+                tree.setdefault(it_path, [])
+            elif it.get("type") == "blob" and it.get("mode") != "120000":  # not a symlink
+                kind = NodeKind.FILE
+                self._shas[it_path] = it["sha"]
+                if "size" in it:
+                    self._sizes[it_path] = it["size"]
+            tree.setdefault(parent, []).append(
+                Entry(path=PurePosixPath(it_path), name=name, kind=kind)
+            )
+        return tree
+
+    def prefetch_dirs(self, dir_paths: Iterable[PurePosixPath]) -> None:
+        if self._tree is not None:
+            return
+        for dir_path in dir_paths:
+            path = str(dir_path)
+            if len(self._pending_listings) >= MAX_PENDING_PREFETCHES:
+                return
+            if path in self._pending_listings:
+                continue
+            self._pending_listings[path] = self._prefetch_pool().submit(self._fetch_listing, path)
+
+    def prefetch_files(self, file_paths: Iterable[PurePosixPath]) -> None:
+        # Only non-empty blobs with a known SHA; the rest resolve on read
+        for file_path in file_paths:
+            key = str(file_path)
+            sha = self._shas.get(key)
+            if sha is None or self._sizes.get(key) == 0:
+                continue
+            if sha in self._pending_blobs or _blob_cache.get(sha) is not None:
+                continue
+            if len(self._pending_blobs) >= MAX_PENDING_PREFETCHES:
+                return
+            self._pending_blobs[sha] = self._prefetch_pool().submit(self._fetch_blob, sha)
+
+    def _prefetch_pool(self) -> ThreadPoolExecutor:
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=PREFETCH_WORKERS, thread_name_prefix="prin-github"
+            )
+        return self._pool
+
     def list_dir(self, dir_path: PurePosixPath) -> Iterable[Entry]:
         path = str(dir_path)
+        # The repo root resolves to PurePosixPath("") == "."; both indexes key it as ""
+        key = "" if path == "." else path.strip("/")
+        if self._tree is not None:
+            children = self._tree.get(key)
+            if children is not None:
+                return list(children)
+            parent, _, name = key.rpartition("/")
+            if any(e.name == name for e in self._tree.get(parent, ())):
+                raise NotADirectoryError(path or ".")
+            raise FileNotFoundError(path)
+        listing = self._listings.get(key)
+        if listing is None:
+            pending = self._pending_listings.pop(key, None)
+            # A pending fetch re-raises whatever the fetch raised (e.g. NotADirectoryError)
+            listing = pending.result() if pending is not None else self._fetch_listing(key)
+            self._listings[key] = listing
+        return list(listing)
+
+    def _fetch_listing(self, path: str) -> list[Entry]:
         owner, repo, ref = self._ctx.owner, self._ctx.repo, self._ctx.ref
         url = (
             f"{API_BASE}/repos/{owner}/{repo}/contents/{path}"
@@ -123,10 +321,35 @@ class GitHubRepoSource(SourceAdapter):
                 kind = NodeKind.DIRECTORY
             elif it_type == "file":
                 kind = NodeKind.FILE
+                if it.get("sha"):
+                    self._shas[it_path] = it["sha"]
+                if "size" in it:
+                    self._sizes[it_path] = it["size"]
             entries.append(Entry(path=PurePosixPath(it_path), name=it_name, kind=kind))
         return entries
 
     def read_file_bytes(self, file_path: PurePosixPath) -> bytes:
+        # is_empty() and the print that follows read the same file; only the first one downloads
+        key = str(file_path)
+        if self._sizes.get(key) == 0:
+            return b""
+        sha = self._shas.get(key)
+        if sha is not None:
+            blob = _blob_cache.get(sha)
+            if blob is not None:
+                return blob
+        if sha is not None:
+            # The SHA came from a listing, so the blob endpoint skips the Contents API detour
+            pending = self._pending_blobs.pop(sha, None)
+            blob = pending.result() if pending is not None else self._fetch_blob(sha)
+        else:
+            blob, sha = self._download_file(file_path)
+        if sha:
+            self._shas[key] = sha
+            _blob_cache.put(sha, blob)
+        return blob
+
+    def _download_file(self, file_path: PurePosixPath) -> tuple[bytes, str | None]:
         owner, repo, ref = self._ctx.owner, self._ctx.repo, self._ctx.ref
         # Try contents API first
         r = _get(
@@ -135,21 +358,26 @@ class GitHubRepoSource(SourceAdapter):
             params={"ref": ref},
         )
         info = r.json()
+        sha = info.get("sha")
         if info.get("encoding") == "base64" and info.get("content"):
             with suppress(Exception):
-                return base64.b64decode(info["content"], validate=False)
+                return base64.b64decode(info["content"], validate=False), sha
         dl = info.get("download_url")
         if dl:
             # Reuse shared GET with rate-limit/backoff handling
             r2 = _get(self._session, dl, stream=True)
-            return r2.content
+            return r2.content, sha
         # Fallback to blob by sha
-        sha = info.get("sha")
         if sha:
-            r3 = _get(self._session, f"{API_BASE}/repos/{owner}/{repo}/git/blobs/{sha}")
-            data = r3.json()
-            if data.get("encoding") == "base64" and data.get("content"):
-                return base64.b64decode(data["content"], validate=False)
+            return self._fetch_blob(sha), sha
+        return b"", None
+
+    def _fetch_blob(self, sha: str) -> bytes:
+        owner, repo = self._ctx.owner, self._ctx.repo
+        r = _get(self._session, f"{API_BASE}/repos/{owner}/{repo}/git/blobs/{sha}")
+        data = r.json()
+        if data.get("encoding") == "base64" and data.get("content"):
+            return base64.b64decode(data["content"], validate=False)
         return b""
 
     def is_empty(self, file_path: PurePosixPath) -> bool:
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+from pathlib import PurePosixPath
+from typing import Iterable
+
+from ..core import Entry, NodeKind, SourceAdapter
+
+
+class InMemorySource(SourceAdapter):
+    """
+    Serves a tree held in memory, mapping POSIX file paths to their bytes.
+    Directories are implied by the file paths; the tree root is ".".
+    """
+
+    def __init__(self, tree: dict[str, bytes]) -> None:
+        self._files: dict[str, bytes] = {}
+        self._children: dict[str, dict[str, Entry]] = {".": {}}
+        for raw_path, blob in tree.items():
+            path = PurePosixPath(raw_path)
+            self._files[str(path)] = blob
+            self._add_child(path, NodeKind.FILE)
+
+    def _add_child(self, path: PurePosixPath, kind: NodeKind) -> None:
+        parent = str(path.parent)
+        siblings = self._children.get(parent)
+        if siblings is None:
+            siblings = self._children[parent] = {}
+            self._add_child(path.parent, NodeKind.DIRECTORY)
+        siblings.setdefault(path.name, Entry(path=path, name=path.name, kind=kind))
+
+    def resolve_root(self, root_spec: str) -> PurePosixPath:
+        return PurePosixPath(root_spec or ".")
+
+    def list_dir(self, dir_path: PurePosixPath) -> Iterable[Entry]:
+        key = str(dir_path)
+        if key in self._files:
+            raise NotADirectoryError(key)
+        children = self._children.get(key)
+        if children is None:
+            raise FileNotFoundError(key)
+        return list(children.values())
+
+    def read_file_bytes(self, file_path: PurePosixPath) -> bytes:
+        return self._files[str(file_path)]
+
+    def is_empty(self, file_path: PurePosixPath) -> bool:
+        from ..core import is_blob_semantically_empty
+
+        return is_blob_semantically_empty(self.read_file_bytes(file_path))
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import argparse
+import sys
 import textwrap
 from dataclasses import dataclass, field
 from typing import Literal
@@ -13,6 +14,7 @@ from prin.defaults import (
     DEFAULT_INCLUDE_EMPTY,
     DEFAULT_INCLUDE_LOCK,
     DEFAULT_INCLUDE_TESTS,
+    DEFAULT_NO_CACHE,
     DEFAULT_NO_DOCS,
     DEFAULT_NO_EXCLUDE,
     DEFAULT_NO_IGNORE,
@@ -40,14 +42,15 @@ class Context:
     exclude: list[str] = field(default_factory=lambda: list(DEFAULT_EXCLUDE_FILTER))
     no_exclude: bool = DEFAULT_NO_EXCLUDE
     no_ignore: bool = DEFAULT_NO_IGNORE
+    no_cache: bool = DEFAULT_NO_CACHE
     tag: Literal["xml", "md"] = DEFAULT_TAG
     max_files: int | None = None
 
 
-def parse_common_args(argv: list[str] | None = None) -> Context:
+def _build_epilog() -> str:
     from prin.filters import resolve_extensions
 
-    epilog = textwrap.dedent(
+    return textwrap.dedent(
         f"""
         DEFAULT MATCH CRITERIA
         When -e,--extension is unspecified, the following file extensions are matched: {", ".join(resolve_extensions(custom_extensions=[], no_docs=False))}.
@@ -59,11 +62,41 @@ def parse_common_args(argv: list[str] | None = None) -> Context:
         """
     )
 
-    parser = argparse.ArgumentParser(
+
+_EXCLUDE_HELP = "Exclude files or directories by shell-style glob or regex (repeatable)."
+
+
+def _build_exclude_help() -> str:
+    return (
+        _EXCLUDE_HELP
+        + " By default, excludes "
+        + ", ".join(map(_describe_predicate, DEFAULT_EXCLUSIONS))
+        + ", and any files in .gitignore, .git/info/exclude, and ~/.config/git/ignore."
+    )
+
+
+class _LazyHelpArgumentParser(argparse.ArgumentParser):
+    """Builds the epilog and -E help only when help is printed; both are costly to compute."""
+
+    def format_help(self) -> str:
+        self.epilog = _build_epilog()
+        for action in self._actions:
+            if action.dest == "exclude":
+                action.help = _build_exclude_help()
+        return super().format_help()
+
+
+def parse_common_args(argv: list[str] | None = None) -> Context:
+    if argv is None:
+        argv = sys.argv[1:]
+    # Common case: positional paths only. Without a single flag, argparse would just return defaults.
+    if not any(tok.startswith("-") for tok in argv):
+        return Context(paths=list(argv) or [DEFAULT_RUN_PATH])
+
+    parser = _LazyHelpArgumentParser(
         description="Prints the contents of files in a directory or specific file paths",
         add_help=True,
         formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog=epilog,
     )
 
     parser.add_argument(
@@ -134,9 +167,7 @@ def parse_common_args(argv: list[str] | None = None) -> Context:
         "--exclude",
         "--ignore",
         type=str,
-        help="Exclude files or directories by shell-style glob or regex (repeatable). By default, excludes "
-        + ", ".join(map(_describe_predicate, DEFAULT_EXCLUSIONS))
-        + ", and any files in .gitignore, .git/info/exclude, and ~/.config/git/ignore.",
+        help=_EXCLUDE_HELP,
         default=DEFAULT_EXCLUDE_FILTER,
         action="append",
     )
@@ -153,6 +184,12 @@ def parse_common_args(argv: list[str] | None = None) -> Context:
         help="Disable gitignore file processing.",
         default=DEFAULT_NO_IGNORE,
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Bypass the on-disk HTTP cache for remote repositories and fetch fresh data.",
+        default=DEFAULT_NO_CACHE,
+    )
     parser.add_argument(
         "--tag",
         type=str,
@@ -182,6 +219,7 @@ def parse_common_args(argv: list[str] | None = None) -> Context:
         exclude=list(args.exclude or []),
         no_exclude=bool(args.no_exclude),
         no_ignore=bool(args.no_ignore),
+        no_cache=bool(args.no_cache),
         tag=args.tag,
         max_files=args.max_files,
     )
@@ -1,8 +1,15 @@
 from __future__ import annotations
 
+import functools
+import io
+import os
+import re
 import sys
+import tokenize
+from contextlib import suppress
 from dataclasses import dataclass
 from enum import Enum, auto
+from fnmatch import translate
 from pathlib import PurePosixPath
 from typing import Callable, Iterable, Protocol
 
@@ -30,6 +37,14 @@ class SourceAdapter(Protocol):
     def read_file_bytes(self, file_path: PurePosixPath) -> bytes: ...
     def is_empty(self, file_path: PurePosixPath) -> bool: ...
 
+    def prefetch_dirs(self, dir_paths: Iterable[PurePosixPath]) -> None:
+        """Hint that these directories will be listed soon. Latency-bound sources may start early."""
+        return None
+
+    def prefetch_files(self, file_paths: Iterable[PurePosixPath]) -> None:
+        """Hint that these files will be read soon. Latency-bound sources may start early."""
+        return None
+
 
 class Formatter(Protocol):
     def body(self, path: str, text: str) -> str: ...
@@ -41,89 +56,177 @@ def is_text_semantically_empty(text: str) -> bool:
     """
     Return True if text contains only imports, __all__=..., or docstrings.
 
-    Mirrors the behavior used by the filesystem implementation.
+    Mirrors the behavior used by the filesystem implementation. Scans top-level tokens
+    instead of building an AST, so files with real code are rejected at their first statement.
     """
-    import ast
-
     if not text.strip():
         return True
 
     try:
-        tree = ast.parse(text)
-    except SyntaxError:
+        return _has_only_trivial_statements(tokenize.generate_tokens(io.StringIO(text).readline))
+    except (tokenize.TokenError, SyntaxError):
         return False
 
-    for node in ast.iter_child_nodes(tree):
-        if isinstance(node, (ast.Import, ast.ImportFrom)):
+
+def _has_only_trivial_statements(tokens: Iterable[tokenize.TokenInfo]) -> bool:
+    # Statement being consumed: None at a statement boundary, else "import", "string",
+    # "all" (saw `__all__`) or "all=" (saw `__all__ =`).
+    statement: str | None = None
+    depth = 0
+    for tok in tokens:
+        if tok.type in (tokenize.NL, tokenize.COMMENT):
             continue
-        elif isinstance(node, ast.Assign):
-            targets = node.targets
-            if (
-                len(targets) == 1
-                and isinstance(targets[0], ast.Name)
-                and targets[0].id == "__all__"
-            ):
-                continue
-        elif (
-            isinstance(node, ast.Expr)
-            and isinstance(node.value, ast.Constant)
-            and isinstance(node.value.value, str)
-        ):
-            # Docstring
+        if tok.type == tokenize.NEWLINE or (tok.type == tokenize.OP and tok.string == ";"):
+            if statement == "all":
+                return False
+            statement, depth = None, 0
             continue
-        else:
-            return False
+        if tok.type == tokenize.ENDMARKER:
+            return statement != "all"
+
+        if statement is None:
+            if tok.type == tokenize.NAME and tok.string in ("import", "from"):
+                statement = "import"
+            elif tok.type == tokenize.NAME and tok.string == "__all__":
+                statement = "all"
+            elif tok.type == tokenize.STRING and not _is_bytes_literal(tok.string):
+                # Docstring (or any bare string statement)
+                statement = "string"
+            else:
+                return False
+        elif statement == "string":
+            # Only implicit concatenation of plain string literals keeps it a constant
+            if tok.type != tokenize.STRING or _is_bytes_literal(tok.string):
+                return False
+        elif statement == "all":
+            if tok.type != tokenize.OP or tok.string != "=":
+                return False
+            statement = "all="
+        elif statement == "all=" and tok.type == tokenize.OP:
+            if tok.string in "([{":
+                depth += 1
+            elif tok.string in ")]}":
+                depth -= 1
+            elif tok.string == "=" and depth == 0:
+                # Chained assignment; `__all__` is no longer the single target
+                return False
     return True
 
 
-def _is_text_bytes(blob: bytes) -> bool:
-    if not blob:
-        return True
-    if b"\x00" in blob:
-        return False
-    try:
-        blob.decode("utf-8")
-        return True
-    except UnicodeDecodeError:
-        return False
+def _is_bytes_literal(token: str) -> bool:
+    prefix = token[: token.index(token[-1])]
+    return "b" in prefix.lower()
 
 
-def _decode_text(blob: bytes) -> str:
+def _decode_text(blob: bytes) -> str | None:
+    """Decode a text blob in one pass; None means the blob is binary."""
+    if b"\x00" in blob:
+        return None
     try:
         return blob.decode("utf-8")
     except UnicodeDecodeError:
-        return blob.decode("latin-1")
+        return None
 
 
 def is_blob_semantically_empty(blob: bytes) -> bool:
     """Return True if the provided blob represents a semantically empty text file."""
-    if not _is_text_bytes(blob):
+    if b"\x00" in blob or _starts_with_code(blob):
+        return False
+    try:
+        text = blob.decode("utf-8")
+    except UnicodeDecodeError:
         return False
-    text = _decode_text(blob)
     return is_text_semantically_empty(text)
 
 
-class StdoutWriter(Writer):
-    def write(self, text: str) -> None:
-        sys.stdout.write(text)
+# A column-0 line starting an identifier that is not import/from/__all__. A string prefix
+# followed by a quote (r"""Doc""", u"x") is a literal, not a name; the tokenizer decides those.
+_TOP_LEVEL_NAME_RE = re.compile(
+    rb"^(?!(?:import|from|__all__)\b)(?![rRuUbBfF]{1,2}['\"])[A-Za-z_]", re.MULTILINE
+)
+_QUICK_REJECT_WINDOW = 4096
 
 
-class StringWriter(Writer):
+def _starts_with_code(blob: bytes) -> bool:
     """
-    Collects written text into an internal buffer for tests and callers.
+    Cheap, conservative pre-check: True only when a top-level statement that is not an import
+    or `__all__` assignment plainly appears within the first few KB.
 
-    Provides a lightweight Writer implementation that accumulates text and
-    exposes it via the `text()` accessor.
+    Inconclusive cases (the line may continue a bracket, backslash or triple-quoted string)
+    return False and are left to the tokenizer.
     """
+    head = blob[:_QUICK_REJECT_WINDOW]
+    for match in _TOP_LEVEL_NAME_RE.finditer(head):
+        prefix = head[: match.start()]
+        if prefix.count(b'"""') % 2 or prefix.count(b"'''") % 2:
+            continue  # Inside a docstring; a later line may still be code
+        code = b"\n".join(line.partition(b"#")[0] for line in prefix.split(b"\n"))
+        return b"\\" not in code and all(
+            code.count(opening) == code.count(closing)
+            for opening, closing in ((b"(", b")"), (b"[", b"]"), (b"{", b"}"))
+        )
+    return False
+
+
+class StdoutWriter(Writer):
+    """
+    Writes to stdout. When stdout is not a terminal, text is encoded into a local buffer
+    and handed to the underlying binary stream in large chunks; `flush()` writes the rest.
+    Use it as a context manager to flush on exit; a writer that is never flushed still
+    writes its remainder when it is garbage-collected.
+    """
+
+    FLUSH_THRESHOLD = 64 * 1024
 
     def __init__(self) -> None:
-        self._parts: list[str] = []
+        stream = sys.stdout
+        # Interactive output stays unbuffered so it shows up as it is produced
+        self._binary = None if stream.isatty() else getattr(stream, "buffer", None)
+        self._encoding = stream.encoding or "utf-8"
+        self._errors = stream.errors or "strict"
+        self._pending = bytearray()
+
+    def write(self, text: str) -> None:
+        if self._binary is None:
+            sys.stdout.write(text)
+            return
+        self._pending += text.encode(self._encoding, self._errors)
+        if len(self._pending) >= self.FLUSH_THRESHOLD:
+            self.flush()
 
-    def write(self, text: str) -> None:  # Writer protocol
-        self._parts.append(text)
+    def __enter__(self) -> StdoutWriter:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.flush()
+
+    def __del__(self) -> None:
+        # Interpreter shutdown may have closed stdout already; nothing left to write to then
+        with suppress(ValueError, OSError):
+            self.flush()
+
+    def flush(self) -> None:
+        if self._binary is None:
+            sys.stdout.flush()
+            return
+        if self._pending:
+            # Keep ordering with anything written through the text layer
+            sys.stdout.flush()
+            self._binary.write(self._pending)
+            self._pending.clear()
+        self._binary.flush()
+
+
+class StringWriter(io.StringIO, Writer):
+    """
+    Collects written text in memory for tests and callers.
+
+    An `io.StringIO` whose C-level `write` serves the Writer protocol directly;
+    `text()` returns everything written so far.
+    """
 
     def text(self) -> str:
-        return "".join(self._parts)
+        return self.getvalue()
 
 
 class FileBudget:
@@ -141,12 +244,36 @@ class FileBudget:
     def available(self) -> bool:
         return self._remaining is None or self._remaining > 0
 
+    def remaining(self) -> int | None:
+        """Files left to print, or None when unlimited."""
+        return self._remaining
+
     def consume(self) -> None:
         if self._remaining is None:
             return
         if self._remaining > 0:
             self._remaining -= 1
 
+
+@functools.lru_cache(maxsize=16)
+def _compile_extensions(
+    extensions: tuple[str, ...],
+) -> tuple[frozenset[str], tuple[str, ...], re.Pattern[str] | None]:
+    """
+    Partition extension patterns once per distinct list: plain extensions are looked up by
+    suffix, multi-dot ones (e.g. "tar.gz") by endswith, and globs are folded into one regex.
+    All three match case-insensitively, so ".md" also selects "README.MD".
+    """
+    from .filters import is_glob
+
+    suffixes = {"." + p.removeprefix(".").lower() for p in extensions if not is_glob(p)}
+    simple = frozenset(s for s in suffixes if s.count(".") == 1)
+    compound = tuple(s for s in suffixes if s.count(".") > 1)
+    globs = [p for p in extensions if is_glob(p)]
+    glob_re = re.compile("|".join(map(translate, globs)), re.IGNORECASE) if globs else None
+    return simple, compound, glob_re
+
+
 class DepthFirstPrinter:
     def __init__(
         self,
@@ -165,25 +292,46 @@ class DepthFirstPrinter:
         self.extensions = extensions
         self.exclude = exclude
         self._printed_paths: set[str] = set()
+        # The output format is fixed for the whole run; bind its methods once
+        self._format_header = formatter.header
+        self._format_body = formatter.body
+        self._format_binary = formatter.binary
 
         # Use shared filtering primitives
         from . import filters as _filters
 
-        self._pf_is_excluded: Callable[[object, list], bool] = _filters.is_excluded
-        self._pf_is_glob: Callable[[object], bool] = _filters.is_glob
+        self._pf_is_excluded: Callable[[str], bool] = _filters.compile_exclusions(exclude)
+
+        (
+            self._extension_suffixes,
+            self._extension_compound_suffixes,
+            self._extension_glob,
+        ) = _compile_extensions(tuple(extensions))
 
     def run(self, roots: list[str], writer: Writer, budget: "FileBudget | None" = None) -> None:
-        for root_spec in roots or ["."]:
+        visited_roots: set[PurePosixPath] = set()
+        for root_spec in dict.fromkeys(roots or ["."]):
             if budget is not None and budget.spent():
                 return
             root = self.source.resolve_root(root_spec)
+            # The same root spelled differently ("src", "./src/") is traversed once
+            if root in visited_roots:
+                continue
+            visited_roots.add(root)
             stack: list[PurePosixPath] = [root]
             while stack:
                 if budget is not None and budget.spent():
                     return
                 current = stack.pop()
+                # Partition the listing in a single pass; other kinds (symlinks, etc.) are dropped
+                dirs: list[Entry] = []
+                files: list[Entry] = []
                 try:
-                    entries = list(self.source.list_dir(current))
+                    for entry in self.source.list_dir(current):
+                        if entry.kind is NodeKind.DIRECTORY:
+                            dirs.append(entry)
+                        elif entry.kind is NodeKind.FILE:
+                            files.append(entry)
                 except NotADirectoryError:
                     # Treat the current path as a file
                     file_entry = Entry(path=current, name=current.name, kind=NodeKind.FILE)
@@ -192,36 +340,44 @@ class DepthFirstPrinter:
                 except FileNotFoundError:
                     # Skip missing paths
                     continue
-                # Sort directories then files, both case-insensitive
-                dirs = [e for e in entries if e.kind is NodeKind.DIRECTORY]
-                files = [e for e in entries if e.kind is NodeKind.FILE]
-                dirs.sort(key=lambda e: e.name.casefold())
+                # Sort directories then files, both case-insensitive.
+                # Directories are sorted descending so pushing them keeps stack DFS order
+                dirs.sort(key=lambda e: e.name.casefold(), reverse=True)
                 files.sort(key=lambda e: e.name.casefold())
 
-                for entry in reversed(dirs):  # reversed for stack DFS order
-                    if not self._excluded(entry):
-                        stack.append(entry.path)
+                subdirs = [entry.path for entry in dirs if not self._excluded(entry)]
+                if subdirs:
+                    self.source.prefetch_dirs(subdirs)
+                    stack.extend(subdirs)
+
+                files = [
+                    entry
+                    for entry in files
+                    if not self._excluded(entry) and self._extension_match(entry.name)
+                ]
+                # Headers-only output of possibly-empty files never reads contents
+                if files and (not self.only_headers or not self.include_empty):
+                    limit = budget.remaining() if budget is not None else None
+                    self.source.prefetch_files([entry.path for entry in files[:limit]])
 
                 for entry in files:
                     self._handle_file(entry, writer, base=root, budget=budget)
 
     def _excluded(self, entry: Entry) -> bool:
-        # The reference implementation accepts strings/paths/globs/callables
-        return self._pf_is_excluded(str(entry.path), exclude=self.exclude)
+        # Compiled once from the exclusion list; same semantics as filters.is_excluded
+        return self._pf_is_excluded(str(entry.path))
 
     def _extension_match(self, filename: str) -> bool:
         if not self.extensions:
             return True
-        for pattern in self.extensions:
-            if self._pf_is_glob(pattern):
-                from fnmatch import fnmatch
-
-                if fnmatch(filename, pattern):
-                    return True
-            else:
-                if filename.endswith("." + pattern.removeprefix(".")):
-                    return True
-        return False
+        dot = filename.rfind(".")
+        if dot != -1 and filename[dot:].lower() in self._extension_suffixes:
+            return True
+        if self._extension_compound_suffixes and filename.lower().endswith(
+            self._extension_compound_suffixes
+        ):
+            return True
+        return self._extension_glob is not None and self._extension_glob.match(filename) is not None
 
     def _handle_file(
         self,
@@ -240,41 +396,39 @@ class DepthFirstPrinter:
         if budget is not None and budget.spent():
             return
 
-        if not force:
-            if self._excluded(entry):
-                return
-            if not self._extension_match(entry.name):
-                return
-            if not self.include_empty and self.source.is_empty(entry.path):
-                return
+        # Traversal applies exclusions and extensions before calling; explicit roots skip them
+        if not force and not self.include_empty and self.source.is_empty(entry.path):
+            return
 
         path_str = self._display_path(entry.path, base)
         if self.only_headers:
-            writer.write(self.formatter.header(path_str))
+            writer.write(self._format_header(path_str))
             if budget is not None:
                 budget.consume()
             self._printed_paths.add(key)
             return
 
-        blob = self.source.read_file_bytes(entry.path)
-        if _is_text_bytes(blob):
-            text = _decode_text(blob)
-            writer.write(self.formatter.body(path_str, text))
+        text = _decode_text(self.source.read_file_bytes(entry.path))
+        if text is not None:
+            writer.write(self._format_body(path_str, text))
         else:
-            writer.write(self.formatter.binary(path_str))
+            writer.write(self._format_binary(path_str))
         if budget is not None:
             budget.consume()
         self._printed_paths.add(key)
 
     def _display_path(self, path: PurePosixPath, base: PurePosixPath) -> str:
-        # If path is under base, return a relative POSIX path; otherwise absolute
+        # Fast path: roots are resolved once, so a path under base is a plain string suffix
+        path_str, base_str = str(path), str(base)
+        prefix = base_str if base_str.endswith("/") else base_str + "/"
+        if path_str.startswith(prefix):
+            return path_str[len(prefix) :]
+        # Otherwise (the root itself, or a non-canonical base) defer to relpath
         try:
-            import os
-
-            rel = os.path.relpath(str(path), start=str(base))
+            rel = os.path.relpath(path_str, start=base_str)
             if rel == "." or rel == "":
                 return path.name
             # Make sure we use POSIX separators in output
             return rel.replace("\\", "/")
         except Exception:
-            return str(path)
+            return path_str
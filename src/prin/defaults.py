@@ -146,6 +146,7 @@ DEFAULT_EXTENSIONS_FILTER = []
 DEFAULT_EXCLUDE_FILTER = []
 DEFAULT_NO_EXCLUDE = False
 DEFAULT_NO_IGNORE = False
+DEFAULT_NO_CACHE = False
 
 # Output format tag defaults
 DEFAULT_TAG = "xml"
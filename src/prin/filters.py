@@ -1,9 +1,12 @@
 from __future__ import annotations
 
-from fnmatch import fnmatch
+import functools
+import re
+from fnmatch import fnmatch, translate
 from pathlib import Path
-from typing import Any, TypeIs
+from typing import Any, Callable, TypeIs
 
+from pathspec import GitIgnoreSpec
 from typeguard import typechecked
 
 from .defaults import (
@@ -30,6 +33,16 @@ def is_extension(name: str) -> TypeIs[TExtension]:
 @typechecked
 def read_gitignore_file(gitignore_path: Path) -> list[TExclusion]:
     """Read a gitignore-like file and return list of exclusion patterns."""
+    try:
+        mtime_ns = gitignore_path.stat().st_mtime_ns
+    except OSError:
+        return []
+    return list(_read_gitignore_file_cached(gitignore_path, mtime_ns))
+
+
+@functools.lru_cache(maxsize=32)
+def _read_gitignore_file_cached(gitignore_path: Path, mtime_ns: int) -> tuple[str, ...]:
+    # mtime_ns only keys the cache, so an edited file is re-read
     exclusions = []
     try:
         with gitignore_path.open("r", encoding="utf-8") as f:
@@ -39,31 +52,51 @@ def read_gitignore_file(gitignore_path: Path) -> list[TExclusion]:
                     exclusions.append(stripped)
     except (FileNotFoundError, UnicodeDecodeError, PermissionError):
         pass
-    return exclusions
+    return tuple(exclusions)
 
 
 @typechecked
 def get_gitignore_exclusions(paths: list[str]) -> list[TExclusion]:
-    """Get exclusions from gitignore files for given paths."""
-    exclusions = []
+    """
+    Get exclusions from gitignore files for given paths.
 
+    Patterns are compiled once into a gitignore spec per directory root (global ignore
+    patterns included), so each root contributes a single callable exclusion.
+    """
     # Read global git ignore file
-    from pathlib import Path as _P
-
-    home_config_ignore = _P.home() / ".config" / "git" / "ignore"
-    exclusions.extend(read_gitignore_file(home_config_ignore))
+    home_config_ignore = Path.home() / ".config" / "git" / "ignore"
+    global_patterns = read_gitignore_file(home_config_ignore)
 
     # Read gitignore files for each directory path
+    exclusions = []
     for path_str in paths:
-        p = _P(path_str)
+        p = Path(path_str)
         if p.is_dir():
-            gitignore_path = p / ".gitignore"
-            exclusions.extend(read_gitignore_file(gitignore_path))
+            patterns = [
+                *global_patterns,
+                *read_gitignore_file(p / ".gitignore"),
+                *read_gitignore_file(p / ".git" / "info" / "exclude"),
+            ]
+            if patterns:
+                exclusions.append(_gitignore_matcher(patterns, base=p.resolve()))
+
+    if not exclusions and global_patterns:
+        exclusions.append(_gitignore_matcher(global_patterns, base=None))
+    return exclusions
 
-            git_exclude_path = p / ".git" / "info" / "exclude"
-            exclusions.extend(read_gitignore_file(git_exclude_path))
 
-    return exclusions
+def _gitignore_matcher(patterns: list[str], *, base: Path | None) -> Callable[[str], bool]:
+    spec = GitIgnoreSpec.from_lines(patterns)
+    # Gitignore patterns are relative to the directory holding them, so a rooted matcher only
+    # answers for paths under that root (bare names and stems would misfire on anchored patterns).
+    prefix = base.as_posix().rstrip("/") + "/" if base is not None else None
+
+    def is_gitignored(path: str) -> bool:
+        if prefix is None:
+            return spec.match_file(path)
+        return path.startswith(prefix) and spec.match_file(path[len(prefix) :])
+
+    return is_gitignored
 
 
 @typechecked
@@ -145,3 +178,70 @@ def is_excluded(entry: Any, *, exclude: list[TExclusion]) -> bool:
             ):
                 return True
     return False
+
+
+@functools.lru_cache(maxsize=16)
+def _compile_string_exclusions(
+    strings: tuple[str, ...],
+) -> tuple[re.Pattern[str] | None, tuple[str, ...], re.Pattern[str] | None]:
+    # The same lists recur within a process (one printer per source, repeated test runs)
+    substrings: list[str] = []
+    extensions: list[str] = []
+    globs: list[str] = []
+    for _exclude in strings:
+        if _is_glob(_exclude):
+            globs.append(_exclude)
+        elif _is_extension(_exclude):
+            extensions.append(_exclude)
+        else:
+            # '*foo*' over name, path and stem reduces to a substring test on the path
+            substrings.append(_exclude)
+    substring_re = re.compile("|".join(map(re.escape, substrings))) if substrings else None
+    glob_re = re.compile("|".join(map(translate, globs))) if globs else None
+    return substring_re, tuple(extensions), glob_re
+
+
+# Glob characters, or anything pathlib would normalize away ("a//b", "./a", "a/", "")
+_GLOB_OR_UNNORMALIZED_RE = re.compile(r"[*?!\[\]]|//|(?:^|/)\.(?:/|$)|/$|^$")
+
+
+def compile_exclusions(exclude: list[TExclusion]) -> Callable[[str], bool]:
+    """
+    Precompile an exclusion list into a single ``path -> bool`` predicate.
+
+    Equivalent to ``is_excluded(path, exclude=exclude)`` for path strings, but plain substrings
+    and globs are each folded into one regex, and extension exclusions into one endswith tuple,
+    so a path is tested with a handful of C-level calls instead of a Python loop per exclusion.
+    """
+    strings: list[str] = []
+    predicates: list[Callable] = []
+    for _exclude in exclude:
+        if callable(_exclude):
+            predicates.append(_exclude)
+        elif isinstance(_exclude, str):
+            strings.append(_exclude)
+        else:
+            # Unknown exclusion type; keep the reference semantics
+            return functools.partial(is_excluded, exclude=exclude)
+    substring_re, extension_suffixes, glob_re = _compile_string_exclusions(tuple(strings))
+
+    def is_path_excluded(path: str) -> bool:
+        if _GLOB_OR_UNNORMALIZED_RE.search(path):
+            # Glob-like or non-canonical paths: defer to the reference implementation
+            return is_excluded(path, exclude=exclude)
+        name = path.rpartition("/")[2]
+        dot = name.rfind(".")
+        stem = name[:dot] if 0 < dot < len(name) - 1 else name
+        if substring_re is not None and substring_re.search(path):
+            return True
+        if extension_suffixes and (
+            name.endswith(extension_suffixes) or stem.endswith(extension_suffixes)
+        ):
+            return True
+        if glob_re is not None and (
+            glob_re.match(name) or glob_re.match(path) or glob_re.match(stem)
+        ):
+            return True
+        return any(pred(name) or pred(stem) or pred(path) for pred in predicates)
+
+    return is_path_excluded
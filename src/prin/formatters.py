@@ -6,9 +6,9 @@ class XmlFormatter:
         return f"<{path}>\n</{path}>\n"
 
     def body(self, path: str, text: str) -> str:
-        if not text.endswith("\n"):
-            text = text + "\n"
-        return f"<{path}>\n{text}</{path}>\n"
+        # Fold the trailing newline into the single f-string instead of copying text twice
+        newline = "" if text.endswith("\n") else "\n"
+        return f"<{path}>\n{text}{newline}</{path}>\n"
 
     def binary(self, path: str) -> str:
         return f"<{path}/>\n"
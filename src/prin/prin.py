@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import functools
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 
 from .adapters.filesystem import FileSystemSource
-from .adapters.github import GitHubRepoSource
 from .cli_common import Context, derive_filters_and_print_flags, parse_common_args
 from .core import DepthFirstPrinter, FileBudget, StdoutWriter, Writer
 from .formatters import MarkdownFormatter, XmlFormatter
@@ -17,66 +19,79 @@ def main(*, argv: list[str] | None = None, writer: Writer | None = None) -> None
     extensions, exclusions, include_empty, only_headers = derive_filters_and_print_flags(ctx)
 
     formatter = XmlFormatter() if ctx.tag == "xml" else MarkdownFormatter()
-    out_writer = writer or StdoutWriter()
+    # Only the writer created here is ours to flush; a caller's writer is left as is
+    with StdoutWriter() if writer is None else nullcontext(writer) as out_writer:
+        # Split positional inputs into local paths and GitHub URLs
+        # Treat empty-string tokens as no-ops for local paths to avoid unintended CWD traversal
+        local_paths: list[str] = []
+        repo_urls: list[str] = []
+        for tok in dict.fromkeys(ctx.paths):
+            if is_github_url(tok):
+                repo_urls.append(tok)
+            else:
+                if tok != "":
+                    local_paths.append(tok)
 
-    # Split positional inputs into local paths and GitHub URLs
-    # Treat empty-string tokens as no-ops for local paths to avoid unintended CWD traversal
-    local_paths: list[str] = []
-    repo_urls: list[str] = []
-    for tok in ctx.paths:
-        if is_github_url(tok):
-            repo_urls.append(tok)
-        else:
-            if tok != "":
-                local_paths.append(tok)
+        # Global print budget shared across sources
+        budget = FileBudget(ctx.max_files)
 
-    # Global print budget shared across sources
-    budget = FileBudget(ctx.max_files)
-
-    # Filesystem chunk (if any)
-    if local_paths:
-        fs_printer = DepthFirstPrinter(
-            FileSystemSource(),
-            formatter,
-            include_empty=include_empty,
-            only_headers=only_headers,
-            extensions=extensions,
-            exclude=exclusions,
-        )
-        fs_printer.run(local_paths, out_writer, budget=budget)
-
-    # GitHub repos (each rendered independently to the same writer)
-    if repo_urls and not (budget and budget.spent()):
-        from .filters import resolve_exclusions as _resolve_exclusions
-
-        # For remote repos, do not honor local gitignore by design
-        repo_exclusions = _resolve_exclusions(
-            no_exclude=ctx.no_exclude,
-            custom_excludes=ctx.exclude,
-            include_tests=ctx.include_tests,
-            include_lock=ctx.include_lock,
-            include_binary=ctx.include_binary,
-            no_ignore=True,
-            paths=[""],
-        )
-        for url in repo_urls:
-            if budget and budget.spent():
-                break
-            roots: list[str] = []
-            derived = extract_in_repo_subpath(url).strip("/")
-            if derived:
-                roots.append(derived)
-            if not roots:
-                roots = [""]
-            gh_printer = DepthFirstPrinter(
-                GitHubRepoSource(url),
+        # Filesystem chunk (if any)
+        if local_paths:
+            fs_printer = DepthFirstPrinter(
+                FileSystemSource(),
                 formatter,
                 include_empty=include_empty,
                 only_headers=only_headers,
                 extensions=extensions,
-                exclude=repo_exclusions,
+                exclude=exclusions,
+            )
+            fs_printer.run(local_paths, out_writer, budget=budget)
+
+        # GitHub repos (each rendered independently to the same writer)
+        if repo_urls and not (budget and budget.spent()):
+            from .adapters.github import GitHubRepoSource
+            from .filters import resolve_exclusions as _resolve_exclusions
+
+            # For remote repos, do not honor local gitignore by design
+            repo_exclusions = _resolve_exclusions(
+                no_exclude=ctx.no_exclude,
+                custom_excludes=ctx.exclude,
+                include_tests=ctx.include_tests,
+                include_lock=ctx.include_lock,
+                include_binary=ctx.include_binary,
+                no_ignore=True,
+                paths=[""],
             )
-            gh_printer.run(roots, out_writer, budget=budget)
+            # Connecting to a repo (default branch + tree) is network-bound, so the next repo
+            # connects while the current one prints. Only one is built ahead, so a spent budget
+            # wastes at most one connection.
+            make_source = functools.partial(GitHubRepoSource, cache=not ctx.no_cache)
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                upcoming = pool.submit(make_source, repo_urls[0])
+                for index, url in enumerate(repo_urls):
+                    if budget and budget.spent():
+                        upcoming.cancel()
+                        break
+                    source = upcoming.result()
+                    if index + 1 < len(repo_urls):
+                        upcoming = pool.submit(make_source, repo_urls[index + 1])
+                    roots: list[str] = []
+                    derived = extract_in_repo_subpath(url).strip("/")
+                    if derived:
+                        roots.append(derived)
+                    if not roots:
+                        roots = [""]
+                    gh_printer = DepthFirstPrinter(
+                        source,
+                        formatter,
+                        include_empty=include_empty,
+                        only_headers=only_headers,
+                        extensions=extensions,
+                        exclude=repo_exclusions,
+                    )
+                    # Closing stops the source's prefetch workers once its repo is printed
+                    with source:
+                        gh_printer.run(roots, out_writer, budget=budget)
 
 
 if __name__ == "__main__":
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from contextlib import nullcontext
+
 from .adapters.filesystem import FileSystemSource
 from .cli_common import Context, derive_filters_and_print_flags, parse_common_args
 from .core import DepthFirstPrinter, FileBudget, StdoutWriter, Writer
@@ -19,9 +21,10 @@ def main(*, argv: list[str] | None = None, writer: Writer | None = None) -> None
         extensions=extensions,
         exclude=exclusions,
     )
-    out_writer = writer or StdoutWriter()
     budget = FileBudget(ctx.max_files)
-    printer.run(ctx.paths, out_writer, budget=budget)
+    # Only the writer created here is ours to flush; a caller's writer is left as is
+    with StdoutWriter() if writer is None else nullcontext(writer) as out_writer:
+        printer.run(ctx.paths, out_writer, budget=budget)
 
 
 def matches(argv: list[str]) -> bool:
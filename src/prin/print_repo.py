@@ -1,12 +1,15 @@
 from __future__ import annotations
 
-from .adapters.github import GitHubRepoSource
-from .cli_common import Context, derive_filters_and_print_flags, parse_common_args
-from .core import DepthFirstPrinter, FileBudget, StdoutWriter, Writer
-from .defaults import DEFAULT_RUN_PATH
-from .formatters import MarkdownFormatter, XmlFormatter
+from contextlib import nullcontext
+from typing import TYPE_CHECKING
+
 from .util import extract_in_repo_subpath, is_github_url
 
+if TYPE_CHECKING:
+    import requests
+
+    from .core import Writer
+
 
 def main(
     url: str | None = None,
@@ -14,7 +17,15 @@ def main(
     *,
     argv: list[str] | None = None,
     writer: Writer | None = None,
+    session: requests.Session | None = None,
 ) -> None:
+    # Deferred so that matches() stays cheap; the GitHub adapter pulls in the requests stack
+    from .adapters.github import GitHubRepoSource
+    from .cli_common import Context, derive_filters_and_print_flags, parse_common_args
+    from .core import DepthFirstPrinter, FileBudget, StdoutWriter
+    from .defaults import DEFAULT_RUN_PATH
+    from .formatters import MarkdownFormatter, XmlFormatter
+
     ctx: Context = parse_common_args(argv)
     # Special-case: first positional may be a GitHub URL; otherwise, require --repo
     if url is None:
@@ -22,26 +33,20 @@ def main(
             raise ValueError(
                 "A GitHub repository URL must be provided as the first positional argument"
             )
-        url = ctx.paths[0]
+        url, *roots = ctx.paths
         # Derive the initial root from the URL itself, supporting optional blob/ and main|master/ segments
         derived_root = extract_in_repo_subpath(url).strip("/")
-        extra_roots = ctx.paths[1:]
-        paths: list[str] = []
         if derived_root:
-            paths.append(derived_root)
-        paths.extend(extra_roots)
-        if not paths:
-            paths = [""]
-        ctx.paths = paths
+            roots.insert(0, derived_root)
     else:
-        # URL was provided directly; use any provided subpaths, or derive from URL, or default to repo root
-        derived_root = extract_in_repo_subpath(url).strip("/")
-        if ctx.paths and ctx.paths != [DEFAULT_RUN_PATH]:
-            pass  # honor provided paths as-is
-        elif derived_root:
-            ctx.paths = [derived_root]
-        else:
-            ctx.paths = [""]
+        # URL was provided directly; honor provided paths as-is, else derive from URL
+        roots = [] if ctx.paths == [DEFAULT_RUN_PATH] else ctx.paths
+        if not roots:
+            derived_root = extract_in_repo_subpath(url).strip("/")
+            if derived_root:
+                roots = [derived_root]
+    # An empty root is the repository root
+    ctx.paths = roots or [""]
 
     # Allow explicit subpaths from caller (tests) to be appended
     if subpaths:
@@ -52,7 +57,7 @@ def main(
     extensions, exclusions, include_empty, only_headers = derive_filters_and_print_flags(ctx)
 
     formatter = XmlFormatter() if ctx.tag == "xml" else MarkdownFormatter()
-    source = GitHubRepoSource(url)
+    source = GitHubRepoSource(url, session=session, cache=not ctx.no_cache)
     printer = DepthFirstPrinter(
         source,
         formatter,
@@ -62,12 +67,12 @@ def main(
         exclude=exclusions,
     )
 
-    out_writer = writer or StdoutWriter()
     budget = FileBudget(ctx.max_files)
-    printer.run(ctx.paths, out_writer, budget=budget)
+    # Only the writer created here is ours to flush; a caller's writer is left as is
+    with source, StdoutWriter() if writer is None else nullcontext(writer) as out_writer:
+        printer.run(ctx.paths, out_writer, budget=budget)
 
 
 def matches(argv: list[str]) -> bool:
-    if not argv:
-        return False
-    return any(is_github_url(tok) for tok in argv)
+    # URLs are almost always the first positional; any() stops at the first hit
+    return any(map(is_github_url, argv))
@@ -1,21 +1,26 @@
+import functools
 import inspect
 import os
 from typing import Annotated, Callable, NewType
 
 from annotated_types import Predicate
-from typeguard import typechecked
 
 TPath = NewType("TPath", str)
 
 
+_GLOB_CHARS = frozenset("*?![]")
+
+
 def _is_glob(path) -> bool:
-    if not isinstance(path, str):
-        return False
-    return any(c in path for c in "*?![]")
+    return isinstance(path, str) and not _GLOB_CHARS.isdisjoint(path)
+
+
+# On Windows users also type forward slashes, so treat os.altsep as a separator too
+_SEPARATORS = frozenset(sep for sep in (os.sep, os.altsep) if sep)
 
 
 def _is_extension(name: str) -> bool:
-    return name.startswith(".") and os.path.sep not in name
+    return name[:1] == "." and _SEPARATORS.isdisjoint(name)
 
 
 TGlob = Annotated[NewType("TGlob", str), Predicate(_is_glob)]
@@ -30,7 +35,7 @@ TExclusion is a union of:
 """
 
 
-@typechecked
+@functools.cache
 def _describe_predicate(pred: TExclusion) -> str:
     if isinstance(pred, str):
         return pred
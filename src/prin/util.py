@@ -1,23 +1,23 @@
 from __future__ import annotations
 
+import functools
+import re
 from typing import Iterable
-from urllib.parse import urlparse
 
-GITHUB_URL_PATTERNS: tuple[str, ...] = (
-    "https://github.com/",
-    "http://github.com/",
-    "git+https://github.com/",
-)
+# Scheme and host are matched case-insensitively; scheme-less github.com/owner/repo is accepted too
+_GITHUB_URL_RE = re.compile(r"(?:(?:git\+)?https?://)?(?:www\.)?github\.com/", re.IGNORECASE)
+_GITHUB_URL_MIN_LEN = len("github.com/")
 
 
 def is_github_url(token: str) -> bool:
-    tok = token.strip().lower()
-    if tok.startswith("-"):
+    if len(token) < _GITHUB_URL_MIN_LEN or token[:1] == "-":
         return False
-    if any(tok.startswith(p) for p in GITHUB_URL_PATTERNS):
+    if _GITHUB_URL_RE.match(token) is not None:
         return True
-    # Also accept scheme-less github.com/owner/repo[...] tokens
-    return tok.startswith("github.com/") or tok.startswith("www.github.com/")
+    # Rare: whitespace-prefixed tokens (e.g. copied from a shell script)
+    if token[:1].isspace():
+        return is_github_url(token.lstrip())
+    return False
 
 
 def find_github_url(argv: Iterable[str]) -> tuple[int, str] | None:
@@ -27,6 +27,7 @@ def find_github_url(argv: Iterable[str]) -> tuple[int, str] | None:
     return None
 
 
+@functools.lru_cache(maxsize=128)
 def extract_in_repo_subpath(url: str) -> str:
     """
     Return the path inside the repo from a GitHub URL.
@@ -42,18 +43,27 @@ def extract_in_repo_subpath(url: str) -> str:
     - Strip an initial 'main/' or 'master/' segment if present.
     - Everything after these optional segments is the subpath (may be empty).
     """
-    parsed = urlparse(url)
-    raw_path = (parsed.path or "").strip("/")
-    if not raw_path:
+    # Hand-rolled split: skip "scheme://host" (or a scheme-less host), drop query/fragment
+    scheme_end = url.find("://")
+    path_start = url.find("/", scheme_end + 3) if scheme_end != -1 else url.find("/")
+    if path_start == -1:
         return ""
-    segments = raw_path.split("/")
-    if len(segments) < 2:
+    raw_path = url[path_start + 1 :].split("?", 1)[0].split("#", 1)[0].strip("/")
+    # owner / repo / rest
+    segments = raw_path.split("/", 2)
+    if len(segments) < 3:
         return ""
-    rest = segments[2:]
-    if not rest:
+    rest = _strip_leading_segment(segments[2], "blob")
+    for branch in ("main", "master"):
+        stripped = _strip_leading_segment(rest, branch)
+        if stripped is not rest:
+            return stripped
+    return rest
+
+
+def _strip_leading_segment(path: str, segment: str) -> str:
+    if path == segment:
         return ""
-    if rest and rest[0] == "blob":
-        rest = rest[1:]
-    if rest and rest[0] in {"main", "master"}:
-        rest = rest[1:]
-    return "/".join(rest)
+    if path.startswith(segment + "/"):
+        return path[len(segment) + 1 :]
+    return path
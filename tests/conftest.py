@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import functools
+import os
+from pathlib import Path
+from typing import Callable
+
+import pytest
+
+from prin.core import StringWriter
+from prin.util import is_github_url
+from tests.utils import write_many
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _ensure_github_token() -> None:
+    # If not set, load once from ~/.github-token to avoid rate limits in repo tests
+    if os.environ.get("GITHUB_TOKEN"):
+        return
+    try:
+        token = (Path.home() / ".github-token").read_text().strip()
+    except OSError:
+        return
+    if token:
+        os.environ["GITHUB_TOKEN"] = token
+
+
+# Relative path -> content; None means an empty file
+COMPREHENSIVE_TREE: dict[str, bytes | None] = {
+    "src/main.py": b"print('hello')\nprint('world')\n",
+    "src/config.json": b'{\n  "a": 1,\n  "b": 2\n}\n',
+    "src/pkg/module.py": b"def f():\n    return 1\n\nprint(f())\n",
+    "src/pkg/data.jsonl": b'{"x":1}\n{"x":2}\n',
+    "docs/readme.md": b"# Title\n\nSome docs.\n",
+    # Default-ignored categories (lock/test/binary)
+    "poetry.lock": b"dummy\n",
+    "package-lock.json": b"{}\n",
+    "build/artifact.o": None,
+    "__pycache__/module.pyc": None,
+    "tests/test_something.py": b"def test_x():\n    assert True\n",
+}
+
+
+@pytest.fixture(scope="session")
+def comprehensive_fs(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """
+    A 2-3 level tree with interspersed files, built once per session. Treat it as read-only;
+    tests that need extra files should build them under their own tmp_path.
+    """
+    root = tmp_path_factory.mktemp("comprehensive")
+    write_many({root / relpath: content for relpath, content in COMPREHENSIVE_TREE.items()})
+    return root
+
+
+@pytest.fixture(scope="session")
+def repo_runner() -> Callable[..., str]:
+    """
+    Runs `prin` on argv and returns its output, once per distinct argv for the whole session.
+
+    GitHub round-trips dominate repo tests, so tests sharing a URL share the output.
+    Treat the returned text as read-only.
+    """
+
+    @functools.cache
+    def run(*argv: str) -> str:
+        from prin.prin import main as prin_main
+
+        buf = StringWriter()
+        prin_main(argv=list(argv), writer=buf)
+        return buf.text()
+
+    def runner(*argv: str) -> str:
+        # ".../LICENSE" and ".../LICENSE/" are the same request
+        return run(*(tok.rstrip("/") if is_github_url(tok) else tok for tok in argv))
+
+    return runner
@@ -0,0 +1,15 @@
+from __future__ import annotations
+
+import pytest
+
+from prin.cli_common import parse_common_args
+from prin.defaults import DEFAULT_TAG
+
+
+@pytest.mark.parametrize(
+    "paths",
+    [[], ["src"], ["src", "README.md"], ["github.com/owner/repo", "docs"], [""]],
+)
+def test_positional_only_argv_matches_full_parse(paths: list[str]):
+    # Passing a default-valued flag forces the argparse path without changing the result
+    assert parse_common_args(paths) == parse_common_args(["--tag", DEFAULT_TAG, *paths])
@@ -2,23 +2,19 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import pytest
+
 from prin.adapters.filesystem import FileSystemSource
-from prin.core import DepthFirstPrinter, StringWriter
+from prin.adapters.memory import InMemorySource
+from prin.core import DepthFirstPrinter, SourceAdapter, StringWriter
 from prin.defaults import DEFAULT_BINARY_EXCLUSIONS, DEFAULT_EXCLUSIONS
 from prin.formatters import XmlFormatter
+from tests.utils import write_many
 
+_DEFAULT_EXCLUDE = [*DEFAULT_EXCLUSIONS, *DEFAULT_BINARY_EXCLUSIONS]
 
-def _write(p: Path, content: str) -> None:
-    p.parent.mkdir(parents=True, exist_ok=True)
-    p.write_text(content, encoding="utf-8")
-
-
-def _touch(p: Path) -> None:
-    p.parent.mkdir(parents=True, exist_ok=True)
-    p.touch()
 
-
-def _run(src: FileSystemSource, roots: list[str]) -> str:
+def _run(src: SourceAdapter, roots: list[str], exclude: list = _DEFAULT_EXCLUDE) -> str:
     buf = StringWriter()
     printer = DepthFirstPrinter(
         src,
@@ -26,41 +22,45 @@ def _run(src: FileSystemSource, roots: list[str]) -> str:
         include_empty=True,
         only_headers=False,
         extensions=[".py", ".md", ".json"],
-        exclude=[*DEFAULT_EXCLUSIONS, *DEFAULT_BINARY_EXCLUSIONS],
+        exclude=exclude,
     )
     printer.run(roots, buf)
     return buf.text()
 
 
-def test_explicit_single_ignored_file_is_printed(tmp_path: Path):
-    # Create an ignored-by-default file (e.g., binary-like or lock)
-    lock = tmp_path / "poetry.lock"
-    _write(lock, "dummy\n")
-    out = _run(FileSystemSource(root_cwd=tmp_path), [str(lock)])
-    assert "<poetry.lock>" in out
+@pytest.fixture
+def lock_tree(tmp_path: Path) -> Path:
+    # An ignored-by-default file (e.g., binary-like or lock)
+    write_many({tmp_path / "poetry.lock": b"dummy\n"})
+    return tmp_path
 
 
-def test_two_sibling_directories(tmp_path: Path):
-    # dirA and dirB siblings, each with printable files
-    _write(tmp_path / "dirA" / "a.py", "print('a')\n")
-    _write(tmp_path / "dirB" / "b.md", "# b\n")
+@pytest.mark.parametrize(
+    "exclude",
+    [_DEFAULT_EXCLUDE, ["poetry.lock", "*.lock"], ["*.lock", lambda path: path.endswith(".lock")]],
+    ids=["defaults", "manual", "glob-and-predicate"],
+)
+def test_explicit_single_ignored_file_is_printed(lock_tree: Path, exclude: list):
     out = _run(
-        FileSystemSource(root_cwd=tmp_path), [str(tmp_path / "dirA"), str(tmp_path / "dirB")]
+        FileSystemSource(root_cwd=lock_tree), [str(lock_tree / "poetry.lock")], exclude=exclude
     )
+    assert "<poetry.lock>" in out
+
+
+def test_two_sibling_directories():
+    # dirA and dirB siblings, each with printable files
+    src = InMemorySource({"dirA/a.py": b"print('a')\n", "dirB/b.md": b"# b\n"})
+    out = _run(src, ["dirA", "dirB"])
     # Paths are relative to each provided root
     assert "<a.py>" in out
     assert "<b.md>" in out
 
 
-def test_directory_and_explicit_ignored_file_inside(tmp_path: Path):
+def test_directory_and_explicit_ignored_file_inside():
     # directory contains mixed files; specify dir and an otherwise-ignored file
-    _write(tmp_path / "work" / "keep.py", "print('ok')\n")
-    _touch(tmp_path / "work" / "__pycache__" / "junk.pyc")
+    src = InMemorySource({"work/keep.py": b"print('ok')\n", "work/__pycache__/junk.pyc": b""})
     # Explicitly pass both the directory and the ignored file path
-    out = _run(
-        FileSystemSource(root_cwd=tmp_path),
-        [str(tmp_path / "work"), str(tmp_path / "work" / "__pycache__" / "junk.pyc")],
-    )
+    out = _run(src, ["work", "work/__pycache__/junk.pyc"])
     # Paths are relative to the directory root when provided
     assert "<keep.py>" in out
     # Even though *.pyc is excluded by default, explicit root forces print
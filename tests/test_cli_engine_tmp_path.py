@@ -3,47 +3,15 @@ from __future__ import annotations
 from pathlib import Path
 
 from prin.adapters.filesystem import FileSystemSource
+from prin.adapters.memory import InMemorySource
 from prin.cli_common import Context, derive_filters_and_print_flags, parse_common_args
 from prin.core import DepthFirstPrinter, StringWriter
 from prin.formatters import XmlFormatter
 
 
-def _write(p: Path, content: str) -> None:
-    """
-    Smell: this and similar functions across this tests/ dir should be moved to a shared tests/utils.py file.
-    """
-    p.write_text(content, encoding="utf-8")
-
-
-def _touch(p: Path) -> None:
-    p.parent.mkdir(parents=True, exist_ok=True)
-    p.touch()
-
-
-def test_cli_engine_happy_path(tmp_path):
-    # Build a 2-3 level tree with interspersed files
-    (tmp_path / "src" / "pkg").mkdir(parents=True)
-    (tmp_path / "docs").mkdir()
-
-    # Included-by-default extensions: pick a subset (py, md, json*)
-    _write(tmp_path / "src" / "main.py", "print('hello')\nprint('world')\n")
-    _write(tmp_path / "docs" / "readme.md", "# Title\n\nSome docs.\n")
-    _write(tmp_path / "src" / "config.json", '{\n  "a": 1,\n  "b": 2\n}\n')
-
-    # Nested level
-    _write(tmp_path / "src" / "pkg" / "module.py", "def f():\n    return 1\n\nprint(f())\n")
-    _write(tmp_path / "src" / "pkg" / "data.jsonl", '{"x":1}\n{"x":2}\n')
-
-    # Default-ignored categories (lock/test/binary)
-    _write(tmp_path / "poetry.lock", "dummy\n")
-    _write(tmp_path / "package-lock.json", "{}\n")
-    _touch(tmp_path / "build" / "artifact.o")
-    _touch(tmp_path / "__pycache__" / "module.pyc")  # binary
-    (tmp_path / "tests").mkdir()
-    _write(tmp_path / "tests" / "test_something.py", "def test_x():\n    assert True\n")
-
+def test_cli_engine_happy_path(comprehensive_fs: Path):
     # Use hardcoded filters to isolate traversal/printing happy path
-    src = FileSystemSource(root_cwd=tmp_path)
+    src = FileSystemSource(root_cwd=comprehensive_fs)
     printer = DepthFirstPrinter(
         src,
         XmlFormatter(),
@@ -54,7 +22,7 @@ def test_cli_engine_happy_path(tmp_path):
     )
 
     buf = StringWriter()
-    printer.run([str(tmp_path)], buf)
+    printer.run([str(comprehensive_fs)], buf)
     out = buf.text()
 
     # Included-by-default must appear
@@ -71,14 +39,14 @@ def test_cli_engine_happy_path(tmp_path):
     # but don't assert on default-ignored categories here.
 
 
-def test_cli_engine_isolation(tmp_path):
-    (tmp_path / "dir" / "sub").mkdir(parents=True)
-    _write(tmp_path / "dir" / "a.py", "print('a')\nprint('b')\n")
-    _write(tmp_path / "dir" / "sub" / "b.md", "# b\n\ntext\n")
-    _touch(tmp_path / "__pycache__" / "c.pyc")
+def test_cli_engine_isolation():
+    src = InMemorySource({
+        "dir/a.py": b"print('a')\nprint('b')\n",
+        "dir/sub/b.md": b"# b\n\ntext\n",
+        "__pycache__/c.pyc": b"",
+    })
 
     # Bypass parser-derived filters; hardcode simple includes/excludes
-    src = FileSystemSource(root_cwd=tmp_path)
     printer = DepthFirstPrinter(
         src,
         XmlFormatter(),
@@ -89,14 +57,39 @@ def test_cli_engine_isolation(tmp_path):
     )
 
     buf = StringWriter()
-    # Explicitly pass the tmp_path root to run
-    printer.run([str(tmp_path)], buf)
+    # Explicitly pass the tree root to run
+    printer.run(["."], buf)
     out = buf.text()
     assert "<dir/a.py>" in out
     assert "<dir/sub/b.md>" in out
     assert "__pycache__/c.pyc" not in out
 
 
+def test_extensions_match_case_insensitively():
+    src = InMemorySource({
+        "README.MD": b"Some docs.\n",
+        "Main.Py": b"print('a')\n",
+        "archive.TAR.GZ": b"x\n",
+        "notes.txt": b"text\n",
+    })
+    printer = DepthFirstPrinter(
+        src,
+        XmlFormatter(),
+        include_empty=False,
+        only_headers=False,
+        extensions=["md", ".PY", "tar.gz"],
+        exclude=[],
+    )
+
+    buf = StringWriter()
+    printer.run(["."], buf)
+    out = buf.text()
+    assert "<README.MD>" in out
+    assert "<Main.Py>" in out
+    assert "<archive.TAR.GZ>" in out
+    assert "notes.txt" not in out
+
+
 def test_derive_filters_defaults(tmp_path):
     ctx: Context = parse_common_args([str(tmp_path)])
     extensions, exclusions, include_empty, only_headers = derive_filters_and_print_flags(ctx)
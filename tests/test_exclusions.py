@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import pytest
+
+from prin.defaults import (
+    DEFAULT_BINARY_EXCLUSIONS,
+    DEFAULT_EXCLUSIONS,
+    DEFAULT_LOCK_EXCLUSIONS,
+    DEFAULT_TEST_EXCLUSIONS,
+)
+from prin.filters import compile_exclusions, is_excluded
+
+ALL_DEFAULT_EXCLUSIONS = [
+    *DEFAULT_EXCLUSIONS,
+    *DEFAULT_TEST_EXCLUSIONS,
+    *DEFAULT_LOCK_EXCLUSIONS,
+    *DEFAULT_BINARY_EXCLUSIONS,
+]
+CUSTOM_EXCLUSIONS = ["o/b", ".tar", "*.md", "src/*/gen", "README", lambda x: x == "Makefile"]
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        "src/prin/core.py",
+        "src/prin/__pycache__/core.cpython-313.pyc",
+        "foo/bar/baz",
+        "archive.tar.gz",
+        "docs/README.md",
+        "README",
+        "Makefile",
+        "build",
+        "rebuild.sh",
+        "pkg/node_modules/x/index.js",
+        "tests/test_core.py",
+        "app.spec.ts",
+        "poetry.lock",
+        "image.PNG",
+        "image.png",
+        ".env",
+        "a/.hidden/b",
+        "a..b",
+        "trailing.",
+        "src/x/gen",
+        "weird[1].txt",
+        "a//b.py",
+        "./a.py",
+        "dir/",
+        "",
+    ],
+)
+@pytest.mark.parametrize(
+    "exclude",
+    [[], ALL_DEFAULT_EXCLUSIONS, CUSTOM_EXCLUSIONS],
+    ids=["none", "defaults", "custom"],
+)
+def test_compile_exclusions_matches_is_excluded(path: str, exclude: list):
+    assert compile_exclusions(exclude)(path) is is_excluded(path, exclude=exclude)
@@ -0,0 +1,248 @@
+from __future__ import annotations
+
+import base64
+import gc
+import threading
+import weakref
+from pathlib import PurePosixPath
+
+import pytest
+import requests
+
+from prin.adapters import github as gh
+from prin.adapters.github import GitHubRepoSource
+from prin.core import DepthFirstPrinter, StringWriter
+from prin.formatters import XmlFormatter
+
+# Path -> content; a trailing "/" marks a directory
+_REPO = {
+    "README.md": b"Some docs.\n",
+    "src/": None,
+    "src/main.py": b"print('main')\n",
+    "src/__init__.py": b"",
+    "src/pkg/": None,
+    "src/pkg/util.py": b"def f():\n    return 1\n",
+}
+
+
+class _StubResponse:
+    def __init__(self, status_code: int, data: object) -> None:
+        self.status_code = status_code
+        self.headers: dict[str, str] = {}
+        self._data = data
+
+    def json(self) -> object:
+        return self._data
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code}")
+
+
+class _StubSession:
+    """Serves canned GitHub API JSON by path (after API_BASE) and records every requested path."""
+
+    def __init__(self, routes: dict[str, object]) -> None:
+        self.headers: dict[str, str] = {}
+        self.routes = routes
+        self.requested: list[str] = []
+
+    def get(self, url: str, params=None, stream=False) -> _StubResponse:
+        path = url.removeprefix(gh.API_BASE)
+        self.requested.append(path)
+        if path not in self.routes:
+            return _StubResponse(404, {"message": "Not Found"})
+        return _StubResponse(200, self.routes[path])
+
+
+def _sha(path: str) -> str:
+    return "sha-" + path.rstrip("/")
+
+
+def _tree_item(path: str, content: bytes | None) -> dict:
+    if content is None:
+        return {"path": path.rstrip("/"), "type": "tree", "mode": "040000", "sha": _sha(path)}
+    return {
+        "path": path,
+        "type": "blob",
+        "mode": "100644",
+        "sha": _sha(path),
+        "size": len(content),
+    }
+
+
+def _blob_routes(repo: str) -> dict[str, object]:
+    return {
+        f"/repos/o/{repo}/git/blobs/{_sha(path)}": {
+            "encoding": "base64",
+            "content": base64.b64encode(content).decode(),
+        }
+        for path, content in _REPO.items()
+        if content is not None
+    }
+
+
+def _tree_routes(repo: str = "r", *, truncated: bool = False) -> dict[str, object]:
+    return {
+        f"/repos/o/{repo}": {"default_branch": "main"},
+        f"/repos/o/{repo}/git/trees/main": {
+            "tree": [_tree_item(path, content) for path, content in _REPO.items()],
+            "truncated": truncated,
+        },
+        **_blob_routes(repo),
+    }
+
+
+def _contents_routes() -> dict[str, object]:
+    # Per-directory Contents API listings, used once the recursive tree is truncated
+    listings: dict[str, list[dict]] = {"": []}
+    for path, content in _REPO.items():
+        parent, _, name = path.rstrip("/").rpartition("/")
+        item = {"name": name, "path": path.rstrip("/")}
+        if content is None:
+            item["type"] = "dir"
+            listings[path.rstrip("/")] = []
+        else:
+            item |= {"type": "file", "sha": _sha(path), "size": len(content)}
+        listings[parent].append(item)
+    return {
+        ("/repos/o/r/contents" + (f"/{directory}" if directory else "")): items
+        for directory, items in listings.items()
+    }
+
+
+@pytest.fixture(autouse=True)
+def _fresh_blob_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    # The blob cache is process-wide; start each test cold so requested URLs are deterministic
+    monkeypatch.setattr(gh, "_blob_cache", gh._BlobCache(max_bytes=1024 * 1024))
+    monkeypatch.setattr(gh, "_default_branches", {})
+
+
+def _print(source: GitHubRepoSource, roots: list[str]) -> str:
+    buf = StringWriter()
+    printer = DepthFirstPrinter(
+        source,
+        XmlFormatter(),
+        include_empty=False,
+        only_headers=False,
+        extensions=[],
+        exclude=[],
+    )
+    printer.run(roots, buf)
+    return buf.text()
+
+
+def _blob_requests(session: _StubSession) -> list[str]:
+    return sorted(path for path in session.requested if "/git/blobs/" in path)
+
+
+def test_tree_listing_reads_each_blob_once_by_sha():
+    session = _StubSession(_tree_routes())
+    out = _print(GitHubRepoSource("https://github.com/o/r", session=session), [""])
+
+    assert "<README.md>\nSome docs.\n</README.md>" in out
+    assert "<src/main.py>" in out
+    assert "<src/pkg/util.py>" in out
+    # Empty per the tree's size, so never downloaded and never printed
+    assert "__init__.py" not in out
+    assert session.requested[:2] == ["/repos/o/r", "/repos/o/r/git/trees/main"]
+    # No Contents API calls; each non-empty blob once, even though is_empty and print both read it
+    assert not any("/contents" in path for path in session.requested)
+    assert _blob_requests(session) == [
+        "/repos/o/r/git/blobs/sha-README.md",
+        "/repos/o/r/git/blobs/sha-src/main.py",
+        "/repos/o/r/git/blobs/sha-src/pkg/util.py",
+    ]
+
+
+def test_tree_blobs_are_prefetched_and_consumed():
+    session = _StubSession(_tree_routes())
+    source = GitHubRepoSource("https://github.com/o/r", session=session)
+    source.prefetch_files([PurePosixPath("src/main.py"), PurePosixPath("src/__init__.py")])
+    # Zero-size files are not queued
+    assert list(source._pending_blobs) == ["sha-src/main.py"]
+
+    assert source.read_file_bytes(PurePosixPath("src/main.py")) == b"print('main')\n"
+    assert source.read_file_bytes(PurePosixPath("src/__init__.py")) == b""
+    assert not source._pending_blobs
+    assert _blob_requests(session) == ["/repos/o/r/git/blobs/sha-src/main.py"]
+
+
+def test_closed_source_stops_its_workers_and_can_be_collected():
+    session = _StubSession(_tree_routes())
+    with GitHubRepoSource("https://github.com/o/r", session=session) as source:
+        source.prefetch_files([PurePosixPath("src/main.py")])
+        workers = [t for t in threading.enumerate() if t.name.startswith("prin-github")]
+        assert workers
+    assert not any(t.is_alive() for t in workers)
+
+    ref = weakref.ref(source)
+    del source
+    gc.collect()
+    assert ref() is None
+
+
+def test_tree_list_dir_errors_match_filesystem():
+    source = GitHubRepoSource("https://github.com/o/r", session=_StubSession(_tree_routes()))
+    assert {e.name for e in source.list_dir(PurePosixPath())} == {"README.md", "src"}
+    with pytest.raises(NotADirectoryError):
+        source.list_dir(PurePosixPath("src/main.py"))
+    with pytest.raises(FileNotFoundError):
+        source.list_dir(PurePosixPath("src/missing"))
+
+
+def test_explicit_file_root_is_printed():
+    session = _StubSession(_tree_routes())
+    out = _print(GitHubRepoSource("https://github.com/o/r", session=session), ["src/main.py"])
+    assert out == "<main.py>\nprint('main')\n</main.py>\n"
+
+
+def test_truncated_tree_falls_back_to_contents_listings():
+    session = _StubSession({**_tree_routes(truncated=True), **_contents_routes()})
+    out = _print(GitHubRepoSource("https://github.com/o/r", session=session), [""])
+
+    assert "<src/main.py>" in out
+    assert "<src/pkg/util.py>" in out
+    assert "__init__.py" not in out
+    listings = [path for path in session.requested if "/contents" in path]
+    # One listing per directory, whether prefetched or fetched on demand
+    assert sorted(listings) == [
+        "/repos/o/r/contents",
+        "/repos/o/r/contents/src",
+        "/repos/o/r/contents/src/pkg",
+    ]
+    # Listings carry SHAs, so files are still read through the blob endpoint
+    assert len(_blob_requests(session)) == 3
+
+
+def test_multiple_repos_connect_at_most_one_ahead_of_the_budget(monkeypatch: pytest.MonkeyPatch):
+    from prin.prin import main as prin_main
+
+    session = _StubSession({**_tree_routes("r1"), **_tree_routes("r2"), **_tree_routes("r3")})
+    monkeypatch.setattr(gh, "_shared_session", lambda cache: session)
+    urls = [f"https://github.com/o/{repo}" for repo in ("r1", "r2", "r3")]
+    buf = StringWriter()
+    prin_main(argv=[*urls, "--max-files", "1"], writer=buf)
+
+    assert buf.text().count("</") == 1
+    trees = [path for path in session.requested if "/git/trees/" in path]
+    assert "/repos/o/r3/git/trees/main" not in trees
+
+
+@pytest.mark.parametrize(
+    ("limit", "remaining", "paced"),
+    [("60", "49", False), ("60", "5", True), ("5000", "400", True), ("5000", "600", False)],
+)
+def test_rate_limit_pacing_scales_with_the_quota(
+    monkeypatch: pytest.MonkeyPatch, limit: str, remaining: str, paced: bool
+):
+    sleeps: list[float] = []
+    monkeypatch.setattr(gh.time, "sleep", sleeps.append)
+    resp = _StubResponse(200, {})
+    resp.headers = {
+        "X-RateLimit-Limit": limit,
+        "X-RateLimit-Remaining": remaining,
+        "X-RateLimit-Reset": str(gh.time.time() + 50 * 60),
+    }
+    gh._pace_for_rate_limit(resp)
+    assert bool(sleeps) is paced
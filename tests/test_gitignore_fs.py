@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from prin.core import StringWriter
+from prin.prin import main as prin_main
+from tests.utils import write_many
+
+
+def test_gitignore_patterns_use_gitwildmatch_semantics(tmp_path: Path):
+    write_many({
+        tmp_path / ".gitignore": b"/generated\n*.txt\n!keep.txt\n",
+        tmp_path / "main.py": b"print('main')\n",
+        tmp_path / "generated" / "a.py": b"print('a')\n",
+        tmp_path / "src" / "generated" / "b.py": b"print('b')\n",
+        tmp_path / "app.txt": b"noise\n",
+        tmp_path / "keep.txt": b"signal\n",
+    })
+
+    buf = StringWriter()
+    # tmp_path lives under a pytest-named directory, which the default test exclusions match
+    prin_main(argv=["--include-tests", str(tmp_path)], writer=buf)
+    out = buf.text()
+
+    assert "<main.py>" in out
+    # Anchored pattern only applies at the root
+    assert "<generated/a.py>" not in out
+    assert "<src/generated/b.py>" in out
+    # Negation re-includes
+    assert "<app.txt>" not in out
+    assert "<keep.txt>" in out
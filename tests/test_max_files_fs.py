@@ -2,47 +2,30 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from prin.core import StringWriter
 from prin.prin import main as prin_main
+from tests.utils import CountingWriter, write_many
 
+# Every printed file ends with a closing tag on its own line; self-closing binary tags do not
+_CLOSING_TAG = "\n</"
 
-def _write(p: Path, content: str) -> None:
-    p.parent.mkdir(parents=True, exist_ok=True)
-    p.write_text(content, encoding="utf-8")
 
-
-def _count_opening_xml_tags(text: str) -> int:
-    return sum(
-        1
-        for line in text.splitlines()
-        if line.startswith("<") and not line.startswith("</") and not line.endswith("/>")
-    )
-
-
-def test_max_files_limits_printed_files_all_included(tmp_path: Path):
-    # Build a small tree with 5 printable files
-    _write(tmp_path / "a.py", "print('a')\n")
-    _write(tmp_path / "b.py", "print('b')\n")
-    _write(tmp_path / "dir" / "c.py", "print('c')\n")
-    _write(tmp_path / "dir" / "d.py", "print('d')\n")
-    _write(tmp_path / "dir" / "sub" / "e.py", "print('e')\n")
-
-    buf = StringWriter()
-    prin_main(argv=["--include-tests", "--max-files", "4", str(tmp_path)], writer=buf)
-    out = buf.text()
-    assert _count_opening_xml_tags(out) == 4
+def test_max_files_limits_printed_files_all_included(comprehensive_fs: Path):
+    # The shared tree has 6 printable files once tests are included
+    buf = CountingWriter([_CLOSING_TAG])
+    prin_main(argv=["--include-tests", "--max-files", "4", str(comprehensive_fs)], writer=buf)
+    assert buf.counts[_CLOSING_TAG] == 4
 
 
 def test_max_files_skips_non_matching_and_still_prints_four(tmp_path: Path):
     # 4 printable files and one .lock that should not match by default extensions
-    _write(tmp_path / "a.lock", "dummy\n")  # ensure it sorts early among files
-    _write(tmp_path / "a.py", "print('a')\n")
-    _write(tmp_path / "dir" / "b.py", "print('b')\n")
-    _write(tmp_path / "dir" / "c.py", "print('c')\n")
-    _write(tmp_path / "dir" / "sub" / "d.py", "print('d')\n")
-
-    buf = StringWriter()
+    write_many({
+        tmp_path / "a.lock": b"dummy\n",  # ensure it sorts early among files
+        tmp_path / "a.py": b"print('a')\n",
+        tmp_path / "dir" / "b.py": b"print('b')\n",
+        tmp_path / "dir" / "c.py": b"print('c')\n",
+        tmp_path / "dir" / "sub" / "d.py": b"print('d')\n",
+    })
+
+    buf = CountingWriter([_CLOSING_TAG])
     prin_main(argv=["--include-tests", "--max-files", "4", str(tmp_path)], writer=buf)
-    out = buf.text()
-    assert _count_opening_xml_tags(out) == 4
-
+    assert buf.counts[_CLOSING_TAG] == 4
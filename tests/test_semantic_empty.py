@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import pytest
+
+from prin.core import is_blob_semantically_empty, is_text_semantically_empty
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "",
+        "\n  \n",
+        "import os\n",
+        "from a import (\n    b,\n    c,\n)\n",
+        '"""Module docstring.\n\nUsage:\n    foo\n"""\nimport os\n',
+        "# comment\nimport os; import sys\n",
+        "__all__ = [\n    'a',\n]\n",
+        "__all__ = sorted(dict(a=1))\n",
+        "'implicit' 'concatenation'\n",
+    ],
+)
+def test_semantically_empty(text: str):
+    assert is_text_semantically_empty(text) is True
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "import os\nx = 1\n",
+        "import os; x = 1\n",
+        "def f():\n    pass\n",
+        "__all__ += ['a']\n",
+        "__all__ = x = []\n",
+        "'a'.join(x)\n",
+        "b'bytes'\n",
+        "f'{x}'\n",
+        "import (\n",
+        "Plain prose, not Python.\n",
+    ],
+)
+def test_not_semantically_empty(text: str):
+    assert is_text_semantically_empty(text) is False
+
+
+@pytest.mark.parametrize(
+    ("blob", "expected"),
+    [
+        # Column-0 prose inside a docstring must not trip the quick reject
+        (b'"""Doc.\n\nUsage:\n    x\n"""\nimport os\n', True),
+        (b"from x import (  # )\n    a,\n)\n", True),
+        # String prefixes at column 0 are literals, not code
+        (b'r"""Doc."""\nimport os\n', True),
+        (b'R"""Doc."""\nimport os\n', True),
+        (b'u"Doc."\nimport os\n', True),
+        (b"rb'x'\n", False),
+        (b"import os\n\nclass A:\n    pass\n", False),
+        (b"\x00\x01", False),
+    ],
+)
+def test_blob_semantically_empty(blob: bytes, expected: bool):
+    assert is_blob_semantically_empty(blob) is expected
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import pytest
+
+from prin.adapters.github import _parse_owner_repo
+from prin.util import extract_in_repo_subpath, is_github_url
+
+
+@pytest.mark.parametrize(
+    ("url", "expected"),
+    [
+        ("https://github.com/owner/repo", ""),
+        ("https://github.com/owner/repo/", ""),
+        ("https://github.com/owner/repo/blob/main/dir/file.py", "dir/file.py"),
+        ("https://github.com/owner/repo/master/dir/file.py", "dir/file.py"),
+        ("https://github.com/owner/repo/blob/dir/file.py", "dir/file.py"),
+        ("https://github.com/owner/repo/dir/file.py", "dir/file.py"),
+        ("https://github.com/owner/repo/blob/main", ""),
+        ("https://github.com/owner/repo/mainline/x", "mainline/x"),
+        ("https://github.com/owner/repo/blob/main/LICENSE?plain=1#L3", "LICENSE"),
+        ("git+https://github.com/owner/repo/src/", "src"),
+        ("github.com/owner/repo/blob/main/src", "src"),
+        ("www.github.com/owner/repo", ""),
+    ],
+)
+def test_extract_in_repo_subpath(url: str, expected: str):
+    assert extract_in_repo_subpath(url) == expected
+
+
+@pytest.mark.parametrize(
+    ("token", "expected"),
+    [
+        ("https://github.com/owner/repo", True),
+        ("HTTPS://GitHub.com/owner/repo", True),
+        ("http://www.github.com/owner/repo", True),
+        ("git+https://github.com/owner/repo", True),
+        ("github.com/owner/repo", True),
+        ("  https://github.com/owner/repo", True),
+        ("https://gitlab.com/owner/repo", False),
+        ("notgithub.com/owner/repo", False),
+        ("-https://github.com/owner/repo", False),
+        ("src/github.com/x", False),
+        ("", False),
+    ],
+)
+def test_is_github_url(token: str, expected: bool):
+    assert is_github_url(token) is expected
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "https://github.com/owner/repo",
+        "HTTPS://GitHub.com/owner/repo/",
+        "http://www.github.com/owner/repo/blob/main/x.py",
+        "https://www.github.com/owner/repo",
+        "git+https://www.github.com/owner/repo.git",
+        "github.com/owner/repo",
+        "  https://github.com/owner/repo",
+    ],
+)
+def test_github_urls_parse_to_owner_and_repo(url: str):
+    # Every URL routed to the repo path must be parseable by the adapter
+    assert is_github_url(url)
+    assert _parse_owner_repo(url) == ("owner", "repo")
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from prin.prin import main as prin_main
+from tests.utils import write_many
+
+
+class _WriteOnly:
+    # The bare Writer protocol: no flush()
+    def __init__(self) -> None:
+        self.parts: list[str] = []
+
+    def write(self, text: str) -> None:
+        self.parts.append(text)
+
+
+def test_main_accepts_write_only_writer(tmp_path: Path):
+    write_many({tmp_path / "a.py": b"print('a')\n"})
+    buf = _WriteOnly()
+    prin_main(argv=["--include-tests", str(tmp_path)], writer=buf)
+    assert "<a.py>" in "".join(buf.parts)
+
+
+def test_piped_stdout_writer_is_not_lost_without_flush():
+    # Piped stdout takes the buffered path; dropping the writer must still emit its output
+    code = "from prin.core import StdoutWriter; StdoutWriter().write('hello\\n')"
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, env=env, check=True
+    )
+    assert result.stdout == "hello\n"
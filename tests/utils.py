@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Iterable
+
+from prin.core import Writer
+
+
+def mkdirs(paths: Iterable[Path]) -> None:
+    """
+    Create each directory (and its ancestors) once.
+
+    Deepest paths go first, so one `mkdir(parents=True)` covers all of a path's ancestors and
+    later ancestors in the input are skipped without another syscall.
+    """
+    created: set[Path] = set()
+    for path in sorted(set(paths), key=lambda d: len(d.parts), reverse=True):
+        if path in created:
+            continue
+        path.mkdir(parents=True, exist_ok=True)
+        created.add(path)
+        created.update(path.parents)
+
+
+class CountingWriter(Writer):
+    """
+    Counts occurrences of fixed substrings as text is written, without keeping the output.
+
+    Each needle keeps the last `len(needle) - 1` characters of the stream, so a match split
+    across two `write()` calls is still counted exactly once.
+    """
+
+    def __init__(self, needles: Iterable[str]) -> None:
+        self.counts: dict[str, int] = dict.fromkeys(needles, 0)
+        self._tails: dict[str, str] = dict.fromkeys(self.counts, "")
+
+    def write(self, text: str) -> None:  # Writer protocol
+        for needle, tail in self._tails.items():
+            haystack = tail + text
+            self.counts[needle] += haystack.count(needle)
+            self._tails[needle] = haystack[len(haystack) - len(needle) + 1 :]
+
+
+def write_many(files: dict[Path, bytes | None]) -> None:
+    """Create files in one pass; None means an empty file."""
+    mkdirs(path.parent for path in files)
+    for path, content in files.items():
+        if content is None:
+            path.touch()
+        else:
+            path.write_bytes(content)
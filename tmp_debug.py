@@ -1,14 +1,26 @@
 from pathlib import Path
+
 from prin.core import StringWriter
 from prin.prin import main as prin_main
 
-base = Path('/tmp/prin-debug')
-base.mkdir(parents=True, exist_ok=True)
-(base/'a.py').write_text('print(1)\n', encoding='utf-8')
-(base/'b.py').write_text('print(2)\n', encoding='utf-8')
 
-buf = StringWriter()
-prin_main(argv=['--max-files','4', str(base)], writer=buf)
-out = buf.text()
-print('LEN', len(out))
-print(out)
+def _write_if_changed(path: Path, data: bytes) -> None:
+    try:
+        if path.read_bytes() == data:
+            return
+    except FileNotFoundError:
+        pass
+    path.write_bytes(data)
+
+
+if __name__ == "__main__":
+    base = Path("/tmp/prin-debug")
+    base.mkdir(parents=True, exist_ok=True)
+    _write_if_changed(base / "a.py", b"print(1)\n")
+    _write_if_changed(base / "b.py", b"print(2)\n")
+
+    buf = StringWriter()
+    prin_main(argv=["--max-files", "4", str(base)], writer=buf)
+    out = buf.text()
+    print("LEN", len(out))
+    print(out)